@@ -10,11 +10,12 @@ if cur_version < req_version:
 def cmd_exists(cmd):
 	import subprocess
 	return subprocess.call("type " + cmd, shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE) == 0
-if not cmd_exists("pdflatex"):
-	sys.exit("Please, install pdflatex (sudo apt-get install texlive-full)")
 
 
 def main():
+	if not cmd_exists("pdflatex"):
+		sys.exit("Please, install pdflatex (sudo apt-get install texlive-full)")
+
 	import argparse
 	parser = argparse.ArgumentParser()
 	parser.add_argument("-v", "--verbose", help="Inctrease output verbosity (most verbose: -vvv).", default=0, action="count")
@@ -24,6 +25,7 @@ def main():
 	parser.add_argument("-q", "--question", help="View results of specific question. Arg.: <group>:<question>:<args_id>")
 	parser.add_argument("-d", "--debug", help="View results of algorithm of a specific question. Arg.: <group>:<question>:<arg1>[:<arg2>[:...]]")
 	parser.add_argument("-r", "--replaces", help="Set a replace string for .tex file. Arg.: <key>=<value> [<key>=<value> [...]]", type=str, action="append", nargs='+')
+	parser.add_argument("-o", "--only", help="Generate tests only to specific students. Arg.: <id> [<id> [...]]", type=str, nargs='+')
 	parser.add_argument("--create", help="Create a dummy repository and config file.", action="store_true")
 
 	args = parser.parse_args()
@@ -196,21 +198,17 @@ def main():
 			return
 
 		# Get list of students
-		f = open(data['input']['students'], 'r')
-		students = []
-		for s in f.readlines():
-			try:
-				s = s.replace(' ', '\t')
-				sp   = s.split()
-				id   = sp[0]
-				name = " ".join(sp[1:])
-				students.append([id, name])
-			except IndexError:
-				continue
-		f.close()
+		students, total = loadStudents(data['input'], args.only, args.verbose)
+		if args.only != None:
+			missing = [id for id in args.only if not id in students]
+			if len(missing) > 0:
+				raise Exception("There is no student with id '{}' on '{}' file.".format("', '".join(missing), data['input']['students']))
+		students = students.items()
 
 		if args.verbose:
-			print("There is {} students on '{}' file".format(len(students), data['input']['students']))
+			print("There is {} students on '{}' file".format(total, data['input']['students']))
+			if args.only != None:
+				print("There is {} students selected".format(len(students)))
 
 		# Print tests PDF
 		tests_tex = []
@@ -328,6 +326,99 @@ def loadQuestions(data, questions, ID):
 		result.append(d)
 	return result
 
+def readStudents(path, fmt = None, header = None, columns = None, delimiter = None, encoding = None, verbose = 0):
+	import os
+	if fmt == None: # Guess format from file extension.
+		ext = os.path.splitext(path)[1].lower()
+		fmt = {".csv":"csv", ".jsonl":"jsonl", ".ndjson":"jsonl"}.get(ext, "txt")
+	if encoding == None:
+		encoding = 'utf-8-sig' # Also strips the BOM of Excel exports.
+	try:
+		with open(path, 'r', newline='', encoding=encoding) as f:
+			if fmt == "txt": # <id> <name> (separated by spaces or tabs)
+				for n, s in enumerate(f, 1):
+					sp = s.split()
+					if len(sp) > 0:
+						yield n, sp[0], " ".join(sp[1:])
+			elif fmt == "csv": # <id>,<name>[,<other columns>...]
+				import csv
+				if delimiter == None: # Guess delimiter from the beginning of file.
+					sample = f.read(4096)
+					f.seek(0)
+					try:
+						delimiter = csv.Sniffer().sniff(sample, delimiters=",;\t").delimiter
+					except csv.Error:
+						delimiter = ","
+				reader = csv.reader(f, delimiter=delimiter)
+				first = True
+				col_id, col_name = 0, 1
+				for row in reader:
+					n = reader.line_num
+					row = [c.strip() for c in row]
+					if not any(row):
+						continue
+					if first: # First non-empty row may be a header.
+						first = False
+						cols = [c.lower() for c in row]
+						if columns != None: # Columns named on config: header is required.
+							col_id, col_name = [csvColumn(cols, columns.get(k, k), path) for k in ("id", "name")]
+							continue
+						is_header = "id" in cols or any(c.endswith(" id") for c in cols)
+						if header == True or (header == None and is_header):
+							col_id   = cols.index("id") if "id" in cols else next((i for i, c in enumerate(cols) if c.endswith(" id")), 0)
+							col_name = cols.index("name") if "name" in cols else next(i for i in range(len(cols) + 1) if i != col_id)
+							continue
+						if header == None and verbose:
+							print("Warning: first row '{}' of '{}' read as a student. Set 'students_header' or 'students_columns' if it is a header.".format(delimiter.join(row), path))
+					if len(row) <= col_id or row[col_id] == "":
+						continue
+					yield n, row[col_id], row[col_name] if len(row) > col_name else ""
+			elif fmt == "jsonl": # {"id": <id>, "name": <name>}
+				import json
+				for n, s in enumerate(f, 1):
+					if s.strip() == "":
+						continue
+					try:
+						o = json.loads(s)
+						id, name = o['id'], o.get('name') or ""
+					except (ValueError, KeyError, TypeError, AttributeError):
+						raise Exception("Invalid student on line {} of '{}': {}".format(n, path, s.strip()))
+					if id == None or str(id).strip() == "" or type(id) not in (str, int):
+						raise Exception("Invalid student id on line {} of '{}': {}".format(n, path, s.strip()))
+					if type(name) is not str:
+						raise Exception("Invalid student name on line {} of '{}': {}".format(n, path, s.strip()))
+					yield n, str(id).strip(), name.strip()
+			else:
+				raise Exception("Unknown students format '{}'. Use 'txt', 'csv' or 'jsonl'.".format(fmt))
+	except FileNotFoundError as e:
+		raise Exception("ERROR on readStudents: [{}] {} (\"{}\").".format(e.errno, e.strerror, path))
+	except UnicodeDecodeError as e:
+		raise Exception("ERROR on readStudents: file is not '{}' encoded, set 'students_encoding' ({}) (\"{}\").".format(encoding, e.reason, path))
+
+def csvColumn(cols, name, path):
+	if not name.lower() in cols:
+		raise Exception("There is no column '{}' on header of '{}'.".format(name, path))
+	return cols.index(name.lower())
+
+def loadStudents(config, only = None, verbose = 0):
+	import collections # Index by ID, keeping the file order.
+	path = config['students']
+	students = collections.OrderedDict()
+	seen = None
+	if only != None: # Filtered rows are not kept, but their IDs are needed to report duplicates.
+		only = set(only)
+		seen = set()
+	rows = readStudents(path, config.get('students_format'), config.get('students_header'), config.get('students_columns'),
+	                    config.get('students_delimiter'), config.get('students_encoding'), verbose)
+	for n, id, name in rows:
+		if id in (students if seen == None else seen):
+			raise Exception("Duplicated student id '{}' on line {} of '{}'.".format(id, n, path))
+		if seen != None:
+			seen.add(id)
+		if only == None or id in only:
+			students[id] = name
+	return students, len(students if seen == None else seen)
+
 def loadModulesAbs(path):
 	try:
 		import os, sys
@@ -467,7 +558,9 @@ def question(ID, answer_area = False):
 	"repository":"Questions",
 	"salt":"ChangeThisTextToMakeANewRandomSeed",
 	"input":{
-		"students":"students.txt"
+		"students":"students.txt",
+		"students_format":null,
+		"students_header":null
 	},
 	"output":{
 		"tests":"Tests.pdf",
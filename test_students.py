@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import os, shutil, tempfile, unittest
+
+from MakeTests import loadStudents
+
+class TestStudents(unittest.TestCase):
+	def setUp(self):
+		self.dir = tempfile.mkdtemp()
+
+	def tearDown(self):
+		shutil.rmtree(self.dir)
+
+	def load(self, filename, content, only = None, **config):
+		path = os.path.join(self.dir, filename)
+		with open(path, 'w', encoding='utf-8', newline='') as f:
+			f.write(content)
+		config['students'] = path
+		students, total = loadStudents(config, only)
+		return list(students.items()), total
+
+	def test_txt(self):
+		self.assertEqual(self.load("s.txt", "1 Ann  Smith\n\n2\tBob\n3\n"), ([('1', 'Ann Smith'), ('2', 'Bob'), ('3', '')], 3))
+
+	def test_csv_without_header(self):
+		self.assertEqual(self.load("s.csv", "1,\"Smith, Ann\",ann@x\n2,Bob,bob@x\n"), ([('1', 'Smith, Ann'), ('2', 'Bob')], 2))
+
+	def test_csv_with_header(self):
+		self.assertEqual(self.load("s.csv", "\nid,name,email\n1,Ann,ann@x\n"), ([('1', 'Ann')], 1))
+		self.assertEqual(self.load("s.csv", "Student ID,Name\n1,Ann\n"), ([('1', 'Ann')], 1))
+		self.assertEqual(self.load("s.csv", "RA,Nome\n1,Ann\n", students_header=True), ([('1', 'Ann')], 1))
+		self.assertEqual(self.load("s.csv", "RA,Nome\n1,Ann\n", students_header=False), ([('RA', 'Nome'), ('1', 'Ann')], 2))
+
+	def test_csv_reordered_columns(self):
+		self.assertEqual(self.load("s.csv", "name,id\n,123\nAnn,4\n"), ([('123', ''), ('4', 'Ann')], 2))
+		self.assertEqual(self.load("s.csv", "x,id\n1,2\n"), ([('2', '1')], 1))
+		self.assertEqual(self.load("s.csv", "Course,Nome,RA\nCS,Ann,7\n", students_columns={"id":"ra", "name":"Nome"}), ([('7', 'Ann')], 1))
+		with self.assertRaises(Exception):
+			self.load("s.csv", "Course,Nome\nCS,Ann\n", students_columns={"id":"RA", "name":"Nome"})
+
+	def test_csv_delimiter(self):
+		self.assertEqual(self.load("s.csv", "1;Ann Smith\n2;Bob\n"), ([('1', 'Ann Smith'), ('2', 'Bob')], 2))
+		self.assertEqual(self.load("s.csv", "1|Ann\n", students_delimiter="|"), ([('1', 'Ann')], 1))
+
+	def test_bom(self):
+		self.assertEqual(self.load("s.csv", "\ufeffID,Name\n1,Ann\n"), ([('1', 'Ann')], 1))
+		self.assertEqual(self.load("s.txt", "\ufeff1 Ann\n"), ([('1', 'Ann')], 1))
+
+	def test_encoding(self):
+		path = os.path.join(self.dir, "s.txt")
+		with open(path, 'w', encoding='latin-1') as f:
+			f.write("1 José\n")
+		with self.assertRaises(Exception) as e:
+			loadStudents({'students': path})
+		self.assertIn(path, str(e.exception))
+		self.assertEqual(list(loadStudents({'students': path, 'students_encoding': 'latin-1'})[0].items()), [('1', 'José')])
+
+	def test_jsonl(self):
+		self.assertEqual(self.load("s.jsonl", '{"id": 1, "name": "Ann"}\n\n{"id": "2", "name": null}\n{"id": "3"}\n'), ([('1', 'Ann'), ('2', ''), ('3', '')], 3))
+		for line in ['{"id": null}', '{"id": ""}', '{"id": [1]}', '{"name": "Ann"}', '{"id": 1, "name": 3}', 'not json']:
+			with self.assertRaises(Exception):
+				self.load("s.jsonl", line + "\n")
+
+	def test_duplicates(self):
+		with self.assertRaises(Exception):
+			self.load("s.txt", "1 Ann\n2 Bob\n1 Carl\n")
+		with self.assertRaises(Exception):
+			self.load("s.txt", "1 Ann\n2 Bob\n1 Carl\n", only=['2'])
+
+	def test_only(self):
+		self.assertEqual(self.load("s.txt", "1 Ann\n2 Bob\n3 Carl\n", only=['3', '1']), ([('1', 'Ann'), ('3', 'Carl')], 3))
+
+	def test_format(self):
+		self.assertEqual(self.load("s.dat", "1,Ann\n", students_format="csv"), ([('1', 'Ann')], 1))
+		with self.assertRaises(Exception):
+			self.load("s.txt", "1 Ann\n", students_format="xls")
+
+if __name__ == "__main__":
+	unittest.main()